@@ -3,13 +3,24 @@ import ssl
 import time
 import json
 import random
+import queue
+import atexit
+import weakref
 import logging
+import logging.handlers
+import threading
 import http.cookiejar
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+import itertools
+import functools
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Optional, Union, Tuple
 from urllib.parse import urlparse, parse_qs
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 # Suppress InsecureRequestWarning when verify_ssl=False
 try:
@@ -45,54 +56,321 @@ def _disable_ssl_verification_globally():
     ssl.create_default_context = ssl._create_unverified_context
     _SSL_GLOBALLY_DISABLED = True
 
-# Third-party imports
-import yt_dlp
-from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
-from youtube_transcript_api.formatters import SRTFormatter, TextFormatter
+# Third-party imports: yt_dlp and youtube_transcript_api are heavy (yt_dlp
+# loads hundreds of extractor modules), so they are imported on first use.
 
 # Local imports fallback
 try:
-    from .utils import sanitize_filename, convert_all_srt_to_text
+    from .utils import sanitize_filename, convert_all_srt_to_text, UrlIndex
     from .vtt_to_srt import process_directory
 except ImportError:
+    UrlIndex = set
+
+    class _SanitizeTable(dict):
+        """str.translate table filled on demand: keeps letters, digits and ' ._-'."""
+        def __missing__(self, cp):
+            c = chr(cp)
+            self[cp] = keep = cp if c.isalpha() or c.isdigit() or c in " ._-" else None
+            return keep
+
+    _SANITIZE_TABLE = _SanitizeTable()
+
     def sanitize_filename(name: str) -> str:
-        return "".join([c for c in name if c.isalpha() or c.isdigit() or c in " ._-"]).strip()[:200]
+        return name.translate(_SANITIZE_TABLE).strip()[:200]
     def process_directory(path): pass
     def convert_all_srt_to_text(path, sep): pass
 
 # Constants
 DEFAULT_SUBTITLE_LANGUAGES = ["az", "en", "fa", "tr"]
 DEFAULT_MAX_RESOLUTION = 1080
+DEFAULT_MAX_WORKERS = 4
+MAX_SUBTITLE_WORKERS = 4
+MAX_DISCOVERY_WORKERS = 4
+IO_WORKERS = 2
+DEFAULT_HTTP_CHUNK_SIZE = 10 * 1024 * 1024  # 10 MiB ranged requests
 LOG_FILE = "gorendir.log"
+LOG_FLUSH_EVERY = 200  # file log records buffered between flushes
+LOG_BUFFER_SIZE = 65536
 RATE_LIMIT_INITIAL_SLEEP = 45
 RATE_LIMIT_MAX_RETRIES = 3
+DOWNLOAD_BACKOFF_MAX = 300  # seconds; cap for the shared per-video backoff
+FETCHED_CACHE_SIZE = 64
+URL_LOG_FLUSH_EVERY = 16
+TRANSLATION_SOURCE_LANGS = ('en', 'en-US', 'en-GB')
+# Fields kept in <NN_title>.info.json (the full yt-dlp info dict is huge)
+METADATA_KEYS = (
+    'id', 'title', 'description', 'duration', 'upload_date', 'uploader',
+    'uploader_id', 'channel', 'view_count', 'like_count', 'categories',
+    'tags', 'language', 'webpage_url',
+)
+
+# Finished "NN_title.mp4" outputs and their .info.json sidecars; format
+# partials (.f137.mp4) and merge temps (.temp.mp4) are not finished outputs
+_NUMBERED_MP4_RE = re.compile(r'^(\d+)_.*\.mp4$')
+_NUMBERED_INFO_RE = re.compile(r'^(\d+)_.*\.info\.json$')
+_UNFINISHED_MP4_RE = re.compile(r'\.(?:f\d+|temp)\.mp4$')
+
+# Video ID in watch / shorts / embed / live / youtu.be URLs, compiled once
+_VIDEO_ID_RE = re.compile(
+    r'(?:youtube(?:-nocookie)?\.com/(?:watch\?(?:[^#]*&)?v=|shorts/|embed/|live/|v/)|youtu\.be/)'
+    r'([A-Za-z0-9_-]{11})'
+)
+
+# Welcome banner, built once at import
+_BANNER = "\n" + r"""
+╔═══════════════════════════════════════════════════════════════════╗
+║                                                                   ║
+║   ██████╗  ██████╗ ██████╗ ███████╗███╗   ██╗██████╗ ██╗██████╗   ║
+║  ██╔════╝ ██╔═══██╗██╔══██╗██╔════╝████╗  ██║██╔══██╗██║██╔══██╗  ║
+║  ██║  ███╗██║   ██║██████╔╝█████╗  ██╔██╗ ██║██║  ██║██║██████╔╝  ║
+║  ██║   ██║██║   ██║██╔══██╗██╔══╝  ██║╚██╗██║██║  ██║██║██╔══██╗  ║
+║  ╚██████╔╝╚██████╔╝██║  ██║███████╗██║ ╚████║██████╔╝██║██║  ██║  ║
+║   ╚═════╝  ╚═════╝ ╚═╝  ╚═╝╚══════╝╚═╝  ╚═══╝╚═════╝ ╚═╝╚═╝  ╚═╝  ║
+║                                                                   ║
+║  Welcome to GÖRENDİR - Your Ultimate YouTube Video Downloader!    ║
+║                                                                   ║
+╚═══════════════════════════════════════════════════════════════════╝
+"""
+
+@functools.lru_cache(maxsize=4096)
+def _video_id(url: str) -> Optional[str]:
+    """Return the 11-character video ID in `url`, or None (memoized)."""
+    if 'youtu' not in url:
+        # Cheap substring test: no YouTube host, nothing to parse
+        return None
+    match = _VIDEO_ID_RE.search(url)
+    if match: return match.group(1)
+    parsed = urlparse(url)
+    if parsed.netloc in ['youtube.com', 'www.youtube.com', 'm.youtube.com']:
+        query = parse_qs(parsed.query)
+        if 'v' in query: return query['v'][0]
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _canonical_url(url: str) -> str:
+    """Normalize any YouTube video URL to its watch?v= form."""
+    vid_id = _video_id(url)
+    return f"https://www.youtube.com/watch?v={vid_id}" if vid_id else url
+
+
+class _TokenBucket:
+    """Thread-safe token bucket shared by every transcript request.
+
+    `rate` tokens per second refill up to `capacity`. On throttling the rate
+    is halved (down to 1/16 of the base rate); each success ramps it back up
+    by 1/8 of the base rate. A rate of None disables pacing.
+    """
+
+    def __init__(self, rate: Optional[float], capacity: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.base_rate is None:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            # Jitter keeps waiting workers from firing in lockstep
+            time.sleep(wait * random.uniform(1.0, 1.5))
+
+    def throttle(self):
+        if self.base_rate is None:
+            return
+        with self._lock:
+            self.rate = max(self.base_rate / 16, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+
+    def relax(self):
+        if self.base_rate is None:
+            return
+        with self._lock:
+            self.rate = min(self.base_rate, self.rate + self.base_rate / 8)
+
+
+def _lang_prefixes(code: str):
+    """Yield 'zh', 'zh-Hans', 'zh-Hans-CN' for 'zh-Hans-CN'."""
+    parts = code.split('-')
+    for i in range(1, len(parts) + 1):
+        yield '-'.join(parts[:i])
+
+
+def _has_min_size(path: Path, min_size: int = 10) -> bool:
+    """True if `path` exists with at least `min_size` bytes (one stat call)."""
+    try:
+        return os.stat(path).st_size >= min_size
+    except OSError:
+        return False
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Write `data` to a sibling temp file, then move it over `path`.
+
+    Readers (and re-runs after a crash) never see a half-written file. The
+    temp name is per thread and created with O_EXCL, so two workers saving
+    the same file can never write into each other's temp file.
+    """
+    tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    try:
+        fd = os.open(tmp, flags, 0o644)
+    except FileExistsError:
+        # Only this thread uses the name, so it is a leftover from a crash
+        tmp.unlink()
+        fd = os.open(tmp, flags, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+# Fixed borders of the per-video and summary boxes
+_BOX_TOP = "╔" + "═" * 78 + "╗"
+_BOX_MID = "╠" + "═" * 78 + "╣"
+_BOX_BOTTOM = "╚" + "═" * 78 + "╝"
+_SUMMARY_HEADER = "║" + " " * 32 + "JOB COMPLETE" + " " * 34 + "║"
+
+@functools.lru_cache(maxsize=None)
+def _formatters():
+    """(SRT, text) transcript formatters; stateless, so shared by every thread."""
+    from youtube_transcript_api.formatters import SRTFormatter, TextFormatter
+    return SRTFormatter(), TextFormatter()
+
+
+def _is_rate_limit_error(exc: Union[Exception, str]) -> bool:
+    """Return True if `exc` (or an error message) looks like YouTube throttling (HTTP 429 / IP block).
+
+    "blocking" is youtube-transcript-api's IpBlocked/RequestBlocked wording; a
+    bare "blocked" would also catch permanent copyright and geo blocks.
+    """
+    err = str(exc).lower()
+    return any(kw in err for kw in ("429", "too many requests", "blocking"))
+
+
+def _retry_after_seconds(exc: Exception) -> Optional[float]:
+    """Extract a numeric Retry-After header from `exc` or its cause, if any."""
+    for candidate in (exc, getattr(exc, 'http_error', None), exc.__cause__, exc.__context__):
+        response = getattr(candidate, 'response', None)
+        value = getattr(response, 'headers', {}).get('Retry-After') if response is not None else None
+        if value:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that flushes every `flush_every` records instead of after each one.
+
+    Warnings and errors are still flushed immediately so they survive a crash.
+    """
+
+    def __init__(self, filename, flush_every: int = LOG_FLUSH_EVERY, buffer_size: int = LOG_BUFFER_SIZE):
+        self.flush_every = flush_every
+        self.buffer_size = buffer_size
+        self._unflushed = 0
+        self._batching = False
+        super().__init__(filename, mode='a', encoding='utf-8')
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding)
+
+    def emit(self, record):
+        self._batching = record.levelno < logging.WARNING
+        try:
+            super().emit(record)
+        finally:
+            self._batching = False
+
+    def flush(self):
+        # StreamHandler.emit calls flush() after every record
+        if self._batching:
+            self._unflushed += 1
+            if self._unflushed < self.flush_every:
+                return
+        self._unflushed = 0
+        super().flush()
+
+def _stop_log_listener():
+    """Flush queued log records and stop the listener thread (idempotent)."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.flush()
+        _log_listener = None
+
+# Drain pending records on interpreter exit
+atexit.register(_stop_log_listener)
 
 def setup_logger():
-    """Configures a professional logger without duplicate printing."""
+    """Configures a professional logger without duplicate printing.
+
+    Records are handed to a queue and written by a background listener
+    thread, so download workers never block on console or disk output.
+    """
+    global _log_listener
     logger = logging.getLogger("gorendir")
     logger.propagate = False 
     
     if logger.hasHandlers():
         logger.handlers.clear()
+    _stop_log_listener()
         
     logger.setLevel(logging.INFO)
     formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", "%H:%M:%S")
+    handlers = []
     
     ch = logging.StreamHandler()
     ch.setFormatter(formatter)
-    logger.addHandler(ch)
+    handlers.append(ch)
     
     try:
-        fh = logging.FileHandler(LOG_FILE, encoding='utf-8', mode='a')
+        fh = _BufferedFileHandler(LOG_FILE)
         fh.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] [%(filename)s:%(lineno)d] %(message)s"))
-        logger.addHandler(fh)
+        handlers.append(fh)
     except Exception:
         pass
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
         
     return logger
 
 logger = setup_logger()
 
+# Downloaders with URLs that may still be pending, flushed at interpreter
+# exit. Registered after the log listener so it runs first (atexit is LIFO).
+_live_downloaders: "weakref.WeakSet" = weakref.WeakSet()
+
+def _flush_all_url_logs():
+    for downloader in list(_live_downloaders):
+        downloader._flush_url_log()
+
+atexit.register(_flush_all_url_logs)
+
 class DownloadError(Exception):
     pass
 
@@ -102,6 +380,10 @@ class _YtdlpQuietLogger:
     yt-dlp writes download progress to its internal logger even when quiet=True.
     We intercept and drop those messages so only our tqdm progress bar is shown.
     """
+    # Kept so a None result (ignoreerrors) can still report the cause; the
+    # caller resets it before each extraction since instances are reused.
+    last_error: Optional[str] = None
+
     def debug(self, msg):
         pass  # Suppress [download] progress and other debug messages
     def warning(self, msg):
@@ -110,9 +392,13 @@ class _YtdlpQuietLogger:
         if any(kw in msg_str for kw in ['error', 'fail', 'sign in', 'bot', 'age-restrict', 'unavailable']):
             logger.warning(f"[yt-dlp] {msg}")
     def error(self, msg):
+        self.last_error = str(msg)
         logger.error(f"[yt-dlp] {msg}")
 
 class YouTubeDownloader:
+
+    # The banner is logged by the first downloader in the process only
+    _banner_shown = False
     
     def __init__(
         self,
@@ -123,31 +409,73 @@ class YouTubeDownloader:
         timeout: int = 30,
         cookies_path: Optional[str] = None,
         verify_ssl: bool = True,
-        ffmpeg_location: Optional[str] = None
+        ffmpeg_location: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        sleep_subtitles: float = 1.0,
+        concurrent_fragments: Optional[int] = None,
+        http_chunk_size: int = DEFAULT_HTTP_CHUNK_SIZE,
+        source_address: Optional[str] = None,
+        quiet: bool = False
     ):
         self.save_directory = Path(save_directory).resolve()
-        self.save_directory.mkdir(parents=True, exist_ok=True)
         self.main_root = self.save_directory / "Download_video"
+        # One atomic call creates save_directory as well (parents=True)
         self.main_root.mkdir(parents=True, exist_ok=True)
 
-        self.subtitle_languages = subtitle_languages or DEFAULT_SUBTITLE_LANGUAGES
+        # De-duplicated once (order kept) so no language is fetched twice
+        self.subtitle_languages = list(dict.fromkeys(subtitle_languages or DEFAULT_SUBTITLE_LANGUAGES))
         self.max_resolution = max_resolution
         self.retry_attempts = retry_attempts
         self.timeout = timeout
         self.cookies_path = cookies_path
         self.verify_ssl = verify_ssl
         self.ffmpeg_location = ffmpeg_location
+        self.quiet = quiet
+        # Parallel DASH/HLS fragment fetches per video, and ranged HTTP chunks
+        self.concurrent_fragments = max(1, concurrent_fragments or min(8, os.cpu_count() or 4))
+        self.http_chunk_size = http_chunk_size
+        # Videos are processed concurrently by a thread pool (the work is
+        # network-bound, so threads overlap the I/O waits cleanly).
+        self.max_workers = max(1, max_workers)
+        self._urls_lock = threading.Lock()
+        # Reusable yt-dlp instances keyed by (thread id, purpose); see _get_ydl
+        self._ydl_pool: Dict[tuple, "yt_dlp.YoutubeDL"] = {}
+        self._ydl_lock = threading.Lock()
+        # Per-thread state (progress milestones) for worker threads
+        self._local = threading.local()
+        # Pause before each video; only non-zero after a rate-limit error
+        self._backoff_seconds = 0.0
+        # Subtitle pacing: one token bucket for every transcript request, so
+        # each video worker averages one request per `sleep_subtitles` seconds
+        # and all of them slow down together on HTTP 429.
+        self.sleep_subtitles = max(0.0, sleep_subtitles)
+        self._subtitle_bucket = _TokenBucket(
+            self.max_workers / self.sleep_subtitles if self.sleep_subtitles else None,
+            capacity=self.max_workers,
+        )
+        # Recently fetched transcripts by timedtext URL, so a video that shows
+        # up in several playlists of one batch is only fetched once per track.
+        self._fetched_cache: "OrderedDict[str, object]" = OrderedDict()
+        self._fetched_lock = threading.Lock()
 
         # Base options for all yt-dlp calls
         # - remote_components: solve YouTube's JS n-challenge via EJS
         # - nocheckcertificate: disable SSL verification when verify_ssl=False
         #   (needed on local machines behind corporate proxies / antivirus SSL
         #    inspection that inject self-signed certificates into the chain)
+        # - socket_timeout: fail stalled connections instead of hanging
+        # - extractor_retries: retry transient metadata errors retry_attempts times
         self._ydl_base_opts = {
             'cookiefile': self.cookies_path,
             'remote_components': ['ejs:github'],
             'nocheckcertificate': not self.verify_ssl,
+            'socket_timeout': self.timeout,
+            'extractor_retries': self.retry_attempts,
         }
+        # Bind outgoing connections to one local address; '0.0.0.0' forces
+        # IPv4 on dual-stack hosts whose IPv6 route stalls.
+        if source_address:
+            self._ydl_base_opts['source_address'] = source_address
 
         if not self.verify_ssl:
             # CRITICAL: Patch the ssl module GLOBALLY so ALL HTTPS connections
@@ -181,65 +509,61 @@ class YouTubeDownloader:
             )
 
         self.downloaded_urls = self._load_downloaded_urls()
+        self._pending_urls: List[str] = []  # flushed to _urls.txt in batches
+        _live_downloaders.add(self)
+        # Small pool for file writes, so disk latency overlaps network waits
+        self._io_pool = ThreadPoolExecutor(max_workers=IO_WORKERS, thread_name_prefix="gorendir-io")
+        # Extractor results of single-video inputs, keyed by canonical URL and
+        # consumed by the download task, so those videos are extracted once.
+        self._info_cache: Dict[str, dict] = {}
+        self._lang_cache: Dict[str, Optional[str]] = {}
+        # Finished NN_*.mp4 / NN_*.info.json names per folder, listed once
+        # per download_video call
+        self._disk_videos: Dict[str, Tuple[Dict[int, List[str]], Dict[int, List[str]]]] = {}
+        self._disk_lock = threading.Lock()
         
         # Initialize API Session
         self.api_session = self._setup_api_session()
+        from youtube_transcript_api import YouTubeTranscriptApi
         self.ytt_api = YouTubeTranscriptApi(http_client=self.api_session)
         
         self._print_ascii_art()
 
     def _print_ascii_art(self):
-        ascii_art = r"""
-╔═══════════════════════════════════════════════════════════════════╗
-║                                                                   ║
-║   ██████╗  ██████╗ ██████╗ ███████╗███╗   ██╗██████╗ ██╗██████╗   ║
-║  ██╔════╝ ██╔═══██╗██╔══██╗██╔════╝████╗  ██║██╔══██╗██║██╔══██╗  ║
-║  ██║  ███╗██║   ██║██████╔╝█████╗  ██╔██╗ ██║██║  ██║██║██████╔╝  ║
-║  ██║   ██║██║   ██║██╔══██╗██╔══╝  ██║╚██╗██║██║  ██║██║██╔══██╗  ║
-║  ╚██████╔╝╚██████╔╝██║  ██║███████╗██║ ╚████║██████╔╝██║██║  ██║  ║
-║   ╚═════╝  ╚═════╝ ╚═╝  ╚═╝╚══════╝╚═╝  ╚═══╝╚═════╝ ╚═╝╚═╝  ╚═╝  ║
-║                                                                   ║
-║  Welcome to GÖRENDİR - Your Ultimate YouTube Video Downloader!    ║
-║                                                                   ║
-╚═══════════════════════════════════════════════════════════════════╝
-"""
-        logger.info("\n" + ascii_art)
-
-    def _print_video_separator(self, title: str, url: str, index: int, total: int, file_prefix: str, playlist_name: str):
+        if self.quiet or YouTubeDownloader._banner_shown:
+            return
+        YouTubeDownloader._banner_shown = True
+        logger.info(_BANNER)
+
+    def _print_video_separator(self, title: str, url: str, index: int, total: Union[int, str], file_prefix: str, playlist_name: str):
+        if not logger.isEnabledFor(logging.INFO):
+            return
         safe_title = (title[:55] + '..') if len(title) > 55 else title
         safe_pl = (playlist_name[:55] + '..') if len(playlist_name) > 55 else playlist_name
-        
-        sep = r"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║ PROCESSING VIDEO [{:>3}/{:>3}]                                                   ║
-╠══════════════════════════════════════════════════════════════════════════════╣
-║ Collection: {:<66} ║
-║ Title:      {:<66} ║
-║ File Index: {:<66} ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-""".format(
-            index, total,
-            safe_pl,
-            safe_title, 
-            f"{file_prefix}_...", 
-        )
-        logger.info(sep)
+        logger.info("\n".join((
+            "",
+            _BOX_TOP,
+            f"║ PROCESSING VIDEO [{index:>3}/{total:>3}]{' ' * 51}║",
+            _BOX_MID,
+            f"║ Collection: {safe_pl:<66} ║",
+            f"║ Title:      {safe_title:<66} ║",
+            f"║ File Index: {file_prefix + '_...':<66} ║",
+            _BOX_BOTTOM,
+            "",
+        )))
     
     def _print_summary(self, results: Dict[str, list]):
-        success_count = len(results['success'])
-        failed_count = len(results['failed'])
-        skipped_count = len(results['skipped'])
-        
-        summary_box = r"""
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                                JOB COMPLETE                                  ║
-╠══════════════════════════════════════════════════════════════════════════════╣
-║   ✅ Success:   {:<56} ║
-║   ❌ Failed:    {:<56} ║
-║   ⏭️ Skipped:   {:<56} ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-""".format(success_count, failed_count, skipped_count)
-        logger.info(summary_box)
+        logger.info("\n".join((
+            "",
+            _BOX_TOP,
+            _SUMMARY_HEADER,
+            _BOX_MID,
+            f"║   ✅ Success:   {len(results['success']):<56} ║",
+            f"║   ❌ Failed:    {len(results['failed']):<56} ║",
+            f"║   ⏭️ Skipped:   {len(results['skipped']):<56} ║",
+            _BOX_BOTTOM,
+            "",
+        )))
         
         # Log failed URLs details
         if results['failed']:
@@ -254,6 +578,27 @@ class YouTubeDownloader:
             "Accept-Language": "en-US,en;q=0.9",
         })
 
+        # One pooled keep-alive adapter for every transcript/translation call,
+        # so only the first request per host pays the TCP+TLS handshake.
+        # Transient server errors are retried here; the final response is
+        # still returned (raise_on_status=False) so youtube_transcript_api can
+        # map it to its own exceptions. 429 is left to the shared token bucket
+        # and `_fetch_transcript`, which pace all workers; retrying it here
+        # would bypass both. Every video worker may run a full set of
+        # subtitle threads, so the pool is sized for that peak.
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=max(20, self.max_workers * MAX_SUBTITLE_WORKERS),
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[500, 502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
         # Honor verify_ssl for the youtube_transcript_api requests session too.
         # When False, requests will skip certificate verification (same effect
         # as yt-dlp's `nocheckcertificate`).
@@ -270,6 +615,46 @@ class YouTubeDownloader:
                 logger.warning(f"Failed to load cookies: {e}")
         return session
 
+    def _get_ydl(self, key: tuple, opts: dict) -> "yt_dlp.YoutubeDL":
+        """Return a reusable YoutubeDL for `key`, creating it on first use.
+
+        YoutubeDL is not thread-safe, so instances are kept per worker thread.
+        Reusing them avoids re-parsing options/cookies for every call and keeps
+        yt-dlp's HTTP connections warm across videos.
+        """
+        pool_key = (threading.get_ident(),) + key
+        ydl = self._ydl_pool.get(pool_key)
+        if ydl is None:
+            import yt_dlp
+            ydl = yt_dlp.YoutubeDL(opts)
+            with self._ydl_lock:
+                self._ydl_pool[pool_key] = ydl
+        return ydl
+
+    def _close_ydl_pool(self):
+        """Close and forget every cached YoutubeDL instance."""
+        with self._ydl_lock:
+            instances = list(self._ydl_pool.values())
+            self._ydl_pool.clear()
+        for ydl in instances:
+            try:
+                ydl.close()
+            except Exception:
+                pass
+
+    def close(self):
+        """Release network resources held by the downloader."""
+        self._close_ydl_pool()
+        self._io_pool.shutdown(wait=True)
+        self.api_session.close()
+        self._flush_url_log()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def _detect_ffmpeg(self) -> Optional[str]:
         """Detect the FFmpeg executable path.
 
@@ -308,6 +693,61 @@ class YouTubeDownloader:
 
         return None
 
+    def _list_numbered_files(self, folder: Path) -> Tuple[Dict[int, List[str]], Dict[int, List[str]]]:
+        """Return ({number: [mp4 stems]}, {number: [info.json names]}) for `folder`.
+
+        The folder is listed once per download_video call with os.scandir;
+        later videos of the same playlist reuse the result.
+        """
+        key = str(folder)
+        with self._disk_lock:
+            listing = self._disk_videos.get(key)
+            if listing is None:
+                mp4s: Dict[int, List[str]] = {}
+                infos: Dict[int, List[str]] = {}
+                try:
+                    with os.scandir(folder) as it:
+                        for entry in it:
+                            name = entry.name
+                            match = _NUMBERED_MP4_RE.match(name)
+                            if match and not _UNFINISHED_MP4_RE.search(name):
+                                mp4s.setdefault(int(match.group(1)), []).append(name[:-len('.mp4')])
+                                continue
+                            match = _NUMBERED_INFO_RE.match(name)
+                            if match:
+                                infos.setdefault(int(match.group(1)), []).append(name)
+                except OSError:
+                    pass
+                listing = self._disk_videos[key] = (mp4s, infos)
+            return listing
+
+    def _video_on_disk(self, folder: Path, number: int, video_id: Optional[str]) -> bool:
+        """Return True if `folder` already holds the finished video `video_id` as number `number`.
+
+        The number alone is not enough (playlists get reordered, reverse mode
+        and start numbers change), so the NN_*.info.json sidecar must carry
+        the same video id and share its name with the NN_*.mp4.
+        """
+        if not video_id:
+            return False
+        mp4s, infos = self._list_numbered_files(folder)
+        stems = mp4s.get(number)
+        if not stems:
+            return False
+        for info_name in infos.get(number, ()):
+            try:
+                with open(folder / info_name, encoding='utf-8') as f:
+                    if json.load(f).get('id') != video_id:
+                        continue
+            except (OSError, ValueError, AttributeError):
+                continue
+            # The sidecar name is our sanitized "NN_<title[:100]>"; yt-dlp
+            # names the video itself, so compare after the same sanitizing
+            info_stem = info_name[:-len('.info.json')]
+            if any(sanitize_filename(stem).startswith(info_stem) for stem in stems):
+                return True
+        return False
+
     def _cleanup_orphaned_partials(self, folder: Path):
         """Remove orphaned yt-dlp partial files (.f137.mp4, .f140.m4a, ...).
 
@@ -356,58 +796,59 @@ class YouTubeDownloader:
         except Exception as e:
             logger.warning(f"Failed to clean up partial files: {e}")
 
-    def _load_downloaded_urls(self) -> set:
+    def _load_downloaded_urls(self) -> UrlIndex:
         log_file = self.save_directory / "_urls.txt"
-        if log_file.exists():
-            try:
-                return set(log_file.read_text(encoding='utf-8').splitlines())
-            except Exception:
-                return set()
-        return set()
+        try:
+            # Stream line by line: the file is never held in memory as one
+            # string plus a list of lines.
+            with open(log_file, encoding='utf-8') as f:
+                return UrlIndex(line.rstrip('\n') for line in f)
+        except Exception:
+            return UrlIndex()
 
     def _save_url_to_log(self, url: str):
-        try:
-            with open(self.save_directory / "_urls.txt", 'a', encoding='utf-8') as f:
-                f.write(url + "\n")
+        with self._urls_lock:
+            self._pending_urls.append(url)
             self.downloaded_urls.add(url)
-        except Exception as e:
-            logger.warning(f"Failed to save URL to log: {e}")
-
-    def _extract_video_id(self, url: str) -> Optional[str]:
-        patterns = [r'(?:youtube\.com\/watch\?v=)([^&#]+)', r'(?:youtu\.be\/)([^&#]+)']
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match: return match.group(1)
-        parsed = urlparse(url)
-        if parsed.netloc in ['youtube.com', 'www.youtube.com', 'm.youtube.com']:
-            query = parse_qs(parsed.query)
-            if 'v' in query: return query['v'][0]
-        return None
+            # Bound what an interrupted run can lose to a few URLs
+            due = len(self._pending_urls) >= URL_LOG_FLUSH_EVERY
+        if due:
+            self._flush_url_log()
+
+    def _flush_url_log(self):
+        """Append all pending URLs to _urls.txt with one write and one fsync."""
+        with self._urls_lock:
+            if not self._pending_urls:
+                return
+            try:
+                with open(self.save_directory / "_urls.txt", 'a', encoding='utf-8') as f:
+                    f.write("\n".join(self._pending_urls) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._pending_urls.clear()
+            except Exception as e:
+                logger.warning(f"Failed to save URLs to log: {e}")
 
-    def _save_metadata(self, info: dict, url: str, assigned_number: int, folder: Path):
+    def _save_metadata(self, info: dict, url: str, assigned_number: int, folder: Path) -> Optional[Future]:
+        """Queue the .info.json write on the I/O pool; returns its future."""
         try:
             title = info.get("title", "Unknown")[:100]
             base_name = sanitize_filename(f"{assigned_number:02d}_{title}")
             json_path = folder / f"{base_name}.info.json"
             
             # Save only essential metadata, not the full info dict (can be very large)
-            essential_info = {
-                'id': info.get('id'),
-                'title': info.get('title'),
-                'description': info.get('description', '')[:500],
-                'duration': info.get('duration'),
-                'upload_date': info.get('upload_date'),
-                'uploader': info.get('uploader'),
-                'uploader_id': info.get('uploader_id'),
-                'channel': info.get('channel'),
-                'view_count': info.get('view_count'),
-                'like_count': info.get('like_count'),
-                'categories': info.get('categories'),
-                'tags': info.get('tags', [])[:20],
-                'language': info.get('language'),
-                'webpage_url': info.get('webpage_url'),
-            }
-            json_path.write_text(json.dumps(essential_info, indent=2, ensure_ascii=False), encoding='utf-8')
+            essential_info = {key: info.get(key) for key in METADATA_KEYS}
+            essential_info['description'] = (info.get('description') or '')[:500]
+            essential_info['tags'] = (info.get('tags') or [])[:20]
+            payload = json.dumps(essential_info, indent=2, ensure_ascii=False).encode('utf-8')
+            return self._io_pool.submit(self._write_metadata, json_path, payload, url)
+        except Exception as e:
+            logger.warning(f"Failed to save metadata: {e}")
+            return None
+
+    def _write_metadata(self, json_path: Path, payload: bytes, url: str):
+        try:
+            _atomic_write(json_path, payload)
             self._save_url_to_log(url)
         except Exception as e:
             logger.warning(f"Failed to save metadata: {e}")
@@ -418,26 +859,27 @@ class YouTubeDownloader:
         playlist_start: int = 1
     ) -> List[Tuple[str, int]]:
         """Normalize all input formats into a list of (url, start_num) tuples."""
-        inputs = []
-        
-        if isinstance(video_urls, str):
-            inputs.append((video_urls, playlist_start))
-        elif isinstance(video_urls, dict):
-            for u, s in video_urls.items():
-                inputs.append((u, s if s > 0 else 1))
-        elif isinstance(video_urls, list):
-            for item in video_urls:
-                if isinstance(item, dict):
-                    for u, s in item.items():
-                        inputs.append((u, s if s > 0 else 1))
-                elif isinstance(item, str):
-                    inputs.append((item, playlist_start))
-                else:
-                    logger.warning(f"Skipping unsupported item type in list: {type(item)}")
-        else:
+        # A lone URL or dict is a one-item list; everything then takes one path
+        if isinstance(video_urls, (str, dict)):
+            video_urls = [video_urls]
+        elif not isinstance(video_urls, (list, tuple)):
             logger.error(f"Unsupported video_urls format: {type(video_urls)}")
+            return []
+
+        inputs = []
+        for item in video_urls:
+            if isinstance(item, dict):
+                inputs.extend((u, s if s > 0 else 1) for u, s in item.items())
+            elif isinstance(item, str):
+                inputs.append((item, playlist_start))
+            else:
+                logger.warning(f"Skipping unsupported item type in list: {type(item)}")
         
-        return inputs
+        # Drop repeated entries (same URL and start) but keep the input order
+        unique = list(dict.fromkeys(inputs))
+        if len(unique) < len(inputs):
+            logger.info(f"Ignoring {len(inputs) - len(unique)} duplicate input(s)")
+        return unique
 
     def download_video(
         self,
@@ -449,6 +891,7 @@ class YouTubeDownloader:
         yt_dlp_write_subs: bool = True,
         download_subtitles: bool = True,
         playlist_end: int = 0,
+        clear_cache: bool = False,
     ) -> Dict[str, list]:
         """
         Download videos from YouTube.
@@ -465,6 +908,7 @@ class YouTubeDownloader:
             yt_dlp_write_subs: If True, yt-dlp writes subtitles
             download_subtitles: If True, download subtitles via API
             playlist_end: If > 0, stop downloading after this many videos
+            clear_cache: If True, wipe yt-dlp's cache directory once before starting
         """
         results: Dict[str, list] = {'success': [], 'failed': [], 'skipped': []}
         
@@ -474,131 +918,264 @@ class YouTubeDownloader:
             logger.error("No valid inputs provided")
             return results
 
-        for url, start_num in inputs:
-            logger.info(f"Analyzing input: {url} (start from #{start_num})")
-            
+        if clear_cache:
+            # Once per batch: stale player/signature data can break extraction,
+            # but wiping it per video would only force needless re-fetches.
             try:
-                with yt_dlp.YoutubeDL({**self._ydl_base_opts, 'extract_flat': True, 'quiet': True, 'logger': _YtdlpQuietLogger()}) as ydl:
-                    info = ydl.extract_info(url, download=False)
+                import yt_dlp
+                with yt_dlp.YoutubeDL({**self._ydl_base_opts, 'quiet': True}) as ydl:
+                    ydl.cache.remove()
+            except Exception as e:
+                logger.warning(f"Failed to clear yt-dlp cache: {e}")
+
+        # Folder listings from an earlier call may be out of date
+        with self._disk_lock:
+            self._disk_videos.clear()
+
+        # Every video task of every input is submitted to one shared pool, so
+        # downloads from different playlists/inputs overlap as well. Inputs are
+        # discovered side by side, each thread queuing its own videos as soon
+        # as their entries arrive.
+        futures = {}
+        target_folders: List[Path] = []
+        # Every submitted video future, so an interrupt can cancel the ones
+        # that have not started (cancel_futures needs Python 3.9)
+        submitted: List[Future] = []
+        stop = threading.Event()
+        discovered: List[Future] = []
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        discovery = ThreadPoolExecutor(max_workers=min(len(inputs), MAX_DISCOVERY_WORKERS))
+        try:
+            discovered = [
+                discovery.submit(
+                    self._queue_input, executor, submitted, stop, url, start_num,
+                    skip_download, force_download, reverse_download,
+                    yt_dlp_write_subs, download_subtitles, playlist_end
+                )
+                for url, start_num in inputs
+            ]
+            # Collected in input order so folders and failures stay ordered
+            for job in discovered:
+                target_folder, queued, error = job.result()
+                if target_folder is not None:
+                    target_folders.append(target_folder)
+                futures.update(queued)
+                if error:
+                    results['failed'].append(error)
+
+            for future in as_completed(futures):
+                v_url = futures[future]
+                try:
+                    res = future.result()
+                except Exception as e:
+                    res = {'error': str(e)}
 
-                if info is None:
-                    logger.error(f"Failed to extract info from {url}")
-                    results['failed'].append({'url': url, 'error': 'No info extracted'})
-                    continue
+                if res.get('skipped'):
+                    results['skipped'].append(v_url)
+                    logger.info(f"⏭️  Skipped: {v_url}")
+                elif res.get('success'):
+                    results['success'].append(v_url)
+                else:
+                    results['failed'].append({'url': v_url, 'error': res.get('error', 'Unknown error')})
+                    logger.info(f"❌ Failed: {res.get('error', 'Unknown error')[:60]}")
+        except BaseException:
+            # Ctrl+C or an error in this thread: stop queuing and drop every
+            # video that has not started; running downloads are let finish.
+            logger.warning("Interrupted, cancelling videos that have not started...")
+            stop.set()
+            executor.shutdown(wait=False)
+            for job in discovered:
+                job.cancel()
+            for future in submitted:
+                future.cancel()
+            raise
+        finally:
+            discovery.shutdown(wait=True)
+            if stop.is_set():
+                # Discovery threads are done now; catch anything they queued
+                # while the first cancel pass was running
+                for future in submitted:
+                    future.cancel()
+            executor.shutdown(wait=True)
+            self._close_ydl_pool()
+            self._flush_url_log()
+
+        # Folder-wide passes run once all workers are done, so they never race
+        # with a download that is still writing into the same folder.
+        for target_folder in target_folders:
+            # Clean up any orphaned partial files (.f137.mp4 / .f140.m4a) left
+            # behind when FFmpeg is missing or a previous merge failed.
+            self._cleanup_orphaned_partials(target_folder)
+            if not skip_download:
+                process_directory(target_folder)
 
-                tasks_to_run = []
-                collection_name = "Unknown"
+        self._print_summary(results)
+        return results
 
-                # Determine Folder Name: Title + Uploader
-                title = info.get('title', 'Unknown')
-                uploader = info.get('uploader', 'Unknown_Uploader')
-                folder_name = sanitize_filename(f"{title}_{uploader}")
+    def _queue_input(
+        self,
+        executor: ThreadPoolExecutor,
+        submitted: List[Future],
+        stop: threading.Event,
+        url: str,
+        start_num: int,
+        skip_download: bool,
+        force_download: bool,
+        reverse_download: bool,
+        yt_dlp_write_subs: bool,
+        download_subtitles: bool,
+        playlist_end: int,
+    ) -> Tuple[Optional[Path], List[tuple], Optional[Dict[str, str]]]:
+        """Discover one input and submit its videos to `executor`.
+
+        Returns (target_folder, [(future, video_url), ...], error). Runs on a
+        discovery thread, so it only touches state that is safe to share.
+        Every future is also appended to `submitted`; queuing ends early once
+        `stop` is set.
+        """
+        queued: List[tuple] = []
+        target_folder = None
 
-                if 'entries' in info:
-                    # PLAYLIST
-                    collection_name = f"Playlist: {title}"
-                    logger.info(f"Detected Playlist: {collection_name} ({info.get('playlist_count', '?')} videos)")
-                    
-                    target_folder = self.main_root / folder_name
-                    target_folder.mkdir(parents=True, exist_ok=True)
-                    
-                    # PLAYLIST PROCESSING LOGIC:
-                    # In normal mode:  V1→01, V2→02, ... V20→20
-                    # In reverse mode: V20→01, V19→02, ... V1→20
-                    # start_num always means "skip N videos from the start of DOWNLOAD order"
-                    #   normal:  skip from beginning of playlist
-                    #   reverse: skip from end of playlist (which is start of reversed order)
-                    #
-                    # Order of operations:
-                    #   1) Filter None entries
-                    #   2) Reverse (if reverse mode) — transforms download order
-                    #   3) Skip by start_num (based on DOWNLOAD order, not original)
-                    #   4) Apply playlist_end limit
-                    #   5) Number from start_num based on download order
-                    
-                    entries = [e for e in info['entries'] if e is not None]
-                    total_original = len(entries)
-                    
-                    # Step 2: Reverse FIRST so skip/numbering work on download order
-                    if reverse_download:
-                        entries.reverse()
-                    
-                    # Step 3: Skip entries before start_num (in DOWNLOAD order)
-                    skip_count = max(0, start_num - 1)
-                    entries = entries[skip_count:]
-                    
-                    # Step 4: Apply playlist_end limit
-                    if playlist_end > 0:
-                        entries = entries[:playlist_end]
-                    
-                    logger.info(f"Will process {len(entries)} videos (skipped first {skip_count} in download order, reverse={reverse_download})")
-                    
-                    # Step 5: Number from start_num based on download order
-                    for i, entry in enumerate(entries):
-                        v_url = entry.get('url') or f"https://www.youtube.com/watch?v={entry.get('id')}"
-                        assigned_num = start_num + i
-                        tasks_to_run.append((v_url, assigned_num))
+        # A plain video URL that is already logged needs no extraction at all
+        canonical = _canonical_url(url)
+        if not force_download and _video_id(url) and 'list=' not in url and canonical in self.downloaded_urls:
+            logger.info(f"Skipping (already downloaded): {canonical}")
+            done: Future = Future()
+            done.set_result({'skipped': True, 'message': 'Already downloaded'})
+            return None, [(done, url)], None
+
+        logger.info(f"Analyzing input: {url} (start from #{start_num})")
+
+        try:
+            # process=False hands back the playlist's entry generator
+            # untouched, so videos are queued page by page while
+            # yt-dlp is still walking the rest of the playlist.
+            ydl = self._get_ydl(('flat',), {**self._ydl_base_opts, 'extract_flat': 'in_playlist', 'lazy_playlist': True, 'quiet': True, 'logger': _YtdlpQuietLogger()})
+            info = ydl.extract_info(url, download=False, process=False)
+            if info and info.get('_type') in ('url', 'url_transparent'):
+                # Redirect-style result (e.g. short links): resolve it
+                info = ydl.extract_info(url, download=False)
+
+            if info is None:
+                logger.error(f"Failed to extract info from {url}")
+                return None, queued, {'url': url, 'error': 'No info extracted'}
+
+            collection_name = "Unknown"
+
+            # Determine Folder Name: Title + Uploader
+            title = info.get('title', 'Unknown')
+            uploader = info.get('uploader', 'Unknown_Uploader')
+            folder_name = sanitize_filename(f"{title}_{uploader}")
+
+            target_folder = self.main_root / folder_name
+            target_folder.mkdir(parents=True, exist_ok=True)
+
+            if 'entries' in info:
+                # PLAYLIST
+                collection_name = f"Playlist: {title}"
+                logger.info(f"Detected Playlist: {collection_name} ({info.get('playlist_count', '?')} videos)")
+
+                # PLAYLIST PROCESSING LOGIC:
+                # In normal mode:  V1→01, V2→02, ... V20→20
+                # In reverse mode: V20→01, V19→02, ... V1→20
+                # start_num always means "skip N videos from the start of DOWNLOAD order"
+                #   normal:  skip from beginning of playlist
+                #   reverse: skip from end of playlist (which is start of reversed order)
+                #
+                # Order of operations:
+                #   1) Filter None entries
+                #   2) Reverse (if reverse mode) — transforms download order
+                #   3) Skip by start_num (based on DOWNLOAD order, not original)
+                #   4) Apply playlist_end limit
+                #   5) Number from start_num based on download order
+
+                entries = (e for e in info['entries'] if e is not None)
+                skip_count = max(0, start_num - 1)
+                stop = skip_count + playlist_end if playlist_end > 0 else None
+
+                if reverse_download:
+                    # Step 2: Reversing needs the whole playlist up front
+                    entries = list(entries)
+                    entries.reverse()
+                    # Steps 3+4: skip and limit in DOWNLOAD order
+                    entries = entries[skip_count:stop]
+                    total_in_batch = len(entries)
                 else:
-                    # SINGLE VIDEO
-                    collection_name = f"Single: {title}"
-                    logger.info(f"Detected Single Video: {collection_name}")
-                    
-                    target_folder = self.main_root / folder_name
-                    target_folder.mkdir(parents=True, exist_ok=True)
-                    
-                    tasks_to_run.append((url, start_num))
-                
-                # Only write _url.txt if target_folder exists and tasks exist
-                if tasks_to_run and target_folder.exists():
+                    # Steps 3+4 applied lazily; the total is unknown until the end
+                    entries = itertools.islice(entries, skip_count, stop)
+                    total_in_batch = None
+
+                logger.info(f"Will process {total_in_batch if total_in_batch is not None else 'all remaining'} videos (skipping first {skip_count} in download order, reverse={reverse_download})")
+
+                # Step 5: Number from start_num based on download order
+                tasks_to_run = (
+                    (entry.get('url') or f"https://www.youtube.com/watch?v={entry.get('id')}", start_num + i, entry.get('title'))
+                    for i, entry in enumerate(entries)
+                )
+            else:
+                # SINGLE VIDEO
+                collection_name = f"Single: {title}"
+                logger.info(f"Detected Single Video: {collection_name}")
+
+                # A single video comes back fully extracted; keep it so
+                # the task does not fetch the same info again.
+                if _video_id(url):
+                    self._info_cache[_canonical_url(url)] = info
+
+                tasks_to_run = iter([(url, start_num, title)])
+                total_in_batch = 1
+
+            # ── Playlist progress ──
+            logger.info(f"📥 Starting playlist: {collection_name[:60]} ({total_in_batch or '?'} videos, {self.max_workers} workers)")
+
+            for idx, (v_url, assigned_num, entry_title) in enumerate(tasks_to_run, 1):
+                if stop.is_set():
+                    break
+                if not queued:
+                    # Only write _url.txt once there is something to download
                     with open(target_folder / "_url.txt", 'w', encoding='utf-8') as f:
                         f.write(url)
-                    
-                total_in_batch = len(tasks_to_run)
-                
-                if total_in_batch == 0:
-                    logger.warning(f"No videos to process for {url} (start_num={start_num} may exceed playlist length)")
-                    continue
-                    
-                # ── Playlist progress ──
-                logger.info(f"📥 Starting playlist: {collection_name[:60]} ({total_in_batch} videos)")
-                
-                for idx, (v_url, assigned_num) in enumerate(tasks_to_run):
-                    # Only sleep after a successful download to avoid wasting time on failures/skips
-                    if results['success']: 
-                        sleep_time = random.uniform(5, 8)
-                        logger.info(f"⏳ Waiting {sleep_time:.1f}s...")
-                        time.sleep(sleep_time)
-
-                    res = self._process_single_task(
-                        v_url, assigned_num, target_folder,
-                        skip_download, force_download, yt_dlp_write_subs, download_subtitles,
-                        idx + 1, total_in_batch, collection_name
-                    )
-
-                    if res.get('skipped'):
-                        results['skipped'].append(v_url)
-                        logger.info(f"⏭️  Skipped: {v_url}")
-                    elif res.get('success'):
-                        results['success'].append(v_url)
-                    else:
-                        results['failed'].append({'url': v_url, 'error': res.get('error', 'Unknown error')})
-                        logger.info(f"❌ Failed: {res.get('error', 'Unknown error')[:60]}")
+                future = executor.submit(
+                    self._run_task,
+                    v_url, assigned_num, target_folder,
+                    skip_download, force_download, yt_dlp_write_subs, download_subtitles,
+                    idx, total_in_batch or '?', collection_name, entry_title
+                )
+                submitted.append(future)
+                queued.append((future, v_url))
 
-                if not skip_download and target_folder.exists():
-                    process_directory(target_folder)
+            if not queued:
+                logger.warning(f"No videos to process for {url} (start_num={start_num} may exceed playlist length)")
 
-            except Exception as e:
-                logger.error(f"Error processing input {url}: {e}")
-                results['failed'].append({'url': url, 'error': str(e)})
+            return target_folder, queued, None
 
-        self._print_summary(results)
-        return results
+        except Exception as e:
+            if stop.is_set():
+                # The executor was shut down under us by an interrupt
+                return target_folder, queued, None
+            logger.error(f"Error processing input {url}: {e}")
+            # Videos queued before a mid-playlist failure still need their folder
+            return target_folder, queued, {'url': url, 'error': str(e)}
 
     def _detect_original_language(self, info: dict) -> Optional[str]:
-        """Detect the original language of a video from metadata."""
+        """Detect the original language of a video from metadata.
+
+        Memoized by video ID, so a video queued from several playlists is
+        only inspected once.
+        """
         if not info:
             return None
-        
+        vid_id = info.get('id')
+        if vid_id in self._lang_cache:
+            return self._lang_cache[vid_id]
+        lang = self._scan_original_language(info)
+        if vid_id:
+            self._lang_cache[vid_id] = lang
+        return lang
+
+    @staticmethod
+    def _scan_original_language(info: dict) -> Optional[str]:
         lang = info.get('language')
         if lang:
             return lang
@@ -610,13 +1187,38 @@ class YouTubeDownloader:
             elif isinstance(audio_languages, str):
                 return audio_languages
         
-        formats = info.get('formats', [])
+        formats = info.get('formats') or []
         for fmt in formats:
+            if fmt.get('acodec') == 'none':
+                continue  # video-only streams carry no audio language
             fmt_lang = fmt.get('language')
             if fmt_lang and fmt_lang not in ('und', None):
                 return fmt_lang
         return None
 
+    def _run_task(self, *args) -> Dict[str, any]:
+        """Run `_process_single_task` on a worker thread.
+
+        A rate-limit error sets a shared 30-60s backoff that doubles on each
+        further hit up to DOWNLOAD_BACKOFF_MAX; any other outcome (success,
+        skip, unrelated failure) halves it. The wait itself happens in
+        `_wait_for_backoff`, right before a task contacts YouTube.
+        """
+        res = self._process_single_task(*args)
+        error = res.get('error')
+        if error and _is_rate_limit_error(error):
+            self._backoff_seconds = min(DOWNLOAD_BACKOFF_MAX, max(self._backoff_seconds * 2, random.uniform(30, 60)))
+        elif self._backoff_seconds:
+            self._backoff_seconds = 0.0 if self._backoff_seconds < 1 else self._backoff_seconds / 2
+        return res
+
+    def _wait_for_backoff(self):
+        """Sleep for the current rate-limit backoff, if any."""
+        backoff = self._backoff_seconds
+        if backoff:
+            logger.info(f"⏳ Rate limited recently, waiting {backoff:.0f}s...")
+            time.sleep(backoff)
+
     def _process_single_task(
         self,
         url: str,
@@ -627,53 +1229,53 @@ class YouTubeDownloader:
         write_subs: bool,
         dl_subs: bool,
         idx: int,
-        total: int,
-        playlist_name: str
+        total: Union[int, str],
+        playlist_name: str,
+        title_hint: Optional[str] = None
     ) -> Dict[str, any]:
-        vid_id = self._extract_video_id(url)
-        canonical = f"https://www.youtube.com/watch?v={vid_id}" if vid_id else url
+        canonical = _canonical_url(url)
         
         if not force and canonical in self.downloaded_urls:
+            self._info_cache.pop(canonical, None)
             logger.info(f"Skipping (already downloaded): {canonical}")
             return {'skipped': True, 'message': 'Already downloaded'}
 
-        # Get Title for UI display
-        video_title = canonical
-        try:
-            with yt_dlp.YoutubeDL({**self._ydl_base_opts, 'quiet': True, 'extract_flat': True, 'logger': _YtdlpQuietLogger()}) as ydl:
-                pre_info = ydl.extract_info(canonical, download=False)
-                if pre_info:
-                    video_title = pre_info.get('title', canonical)
-        except Exception as e:
-            logger.warning(f"Could not fetch title for {canonical}: {e}")
-
+        # Discovery already knows the title (flat playlist entry or the single
+        # video itself); there is no separate metadata request before download.
+        video_title = title_hint or canonical
         self._print_video_separator(video_title, canonical, idx, total, f"{assigned_number:02d}", playlist_name)
-        
+
+        meta_job = None
         try:
-            info = self._fetch_info(canonical)
-            self._save_metadata(info, canonical, assigned_number, target_folder)
-            
-            detected_lang = self._detect_original_language(info)
-            if detected_lang:
-                logger.info(f"Detected Original Audio Language: {detected_lang}")
-            
             # Format selection:
             #   - With FFmpeg: download best video + best audio separately, then
             #     merge into a single .mp4 (high quality, up to max_resolution).
             #   - Without FFmpeg: fall back to a single pre-merged stream so the
             #     user still gets ONE file (lower quality, but no orphaned .fXXX files).
             if self._ffmpeg_path:
-                video_format = (f'bestvideo[height<={self.max_resolution}][ext=mp4]'
-                                f'+bestaudio[ext=m4a]/best[height<={self.max_resolution}]')
+                # One video + one audio stream per alternative, so FFmpeg only
+                # ever stream-copies two inputs; the mp4/m4a pair is preferred.
+                video_format = (f'bestvideo[height<={self.max_resolution}][ext=mp4]+bestaudio[ext=m4a]'
+                                f'/bestvideo[height<={self.max_resolution}]+bestaudio'
+                                f'/best[height<={self.max_resolution}]')
             else:
                 video_format = f'best[height<={self.max_resolution}][ext=mp4]/best[height<={self.max_resolution}]'
 
+            if not skip and not force and self._video_on_disk(target_folder, assigned_number, _video_id(canonical)):
+                # The video file is there (e.g. an earlier run stopped before
+                # the URL log was flushed); metadata and subtitles finish it
+                # and the URL is logged as usual.
+                logger.info(f"  📁 #{assigned_number:02d} already on disk, skipping the video download")
+                skip = True
+
             ydl_opts = {
                 **self._ydl_base_opts,
                 'format': video_format,
                 'merge_output_format': 'mp4',  # Force merge to mp4 when video+audio are separate
                 'paths': {'home': str(target_folder)},
-                'outtmpl': f'{assigned_number:02d}_%(title)s.%(ext)s', 
+                # The number is injected per video via extra_info, so one
+                # YoutubeDL instance can serve every video of the folder.
+                'outtmpl': '%(gorendir_number)02d_%(title)s.%(ext)s',
                 'noplaylist': True,
                 'ignoreerrors': True,
                 'no_overwrites': True,
@@ -686,6 +1288,8 @@ class YouTubeDownloader:
                 'writeautomaticsub': True,
                 'subtitleslangs': self.subtitle_languages,
                 'progress_hooks': [self._progress_hook],
+                'concurrent_fragment_downloads': self.concurrent_fragments,
+                'http_chunk_size': self.http_chunk_size,
             }
             
             if skip:
@@ -693,25 +1297,43 @@ class YouTubeDownloader:
             
             logger.info(f"  ⬇️  Downloading #{assigned_number:02d} — {video_title[:60]}")
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                try:
-                    ydl.cache.remove()
-                except Exception:
-                    pass
-                playlist_info = ydl.extract_info(canonical, download=not skip) or {}
-            
-            if dl_subs and playlist_info:
+            self._wait_for_backoff()
+            ydl = self._get_ydl(('download', str(target_folder), skip, write_subs), ydl_opts)
+            extra_info = {'gorendir_number': assigned_number}
+            ydl_logger = ydl.params.get('logger')
+            if ydl_logger is not None:
+                # The YoutubeDL is pooled; drop the previous video's error
+                ydl_logger.last_error = None
+            discovered = self._info_cache.pop(canonical, None)
+            if discovered is not None:
+                # Single-video input: discovery already ran the extractor, so
+                # only format selection and the download are left to do.
+                info = ydl.process_ie_result(discovered, download=not skip, extra_info=extra_info)
+            else:
+                info = ydl.extract_info(canonical, download=not skip, extra_info=extra_info)
+            if not info:
+                # ignoreerrors makes yt-dlp return None instead of raising;
+                # its logger still saw the reason (e.g. HTTP 429).
+                reason = getattr(ydl_logger, 'last_error', None) or 'No info extracted'
+                logger.error(f"Failed to extract info from {canonical}")
+                return {'error': reason}
+
+            # The info dict of the download call feeds metadata, language
+            # detection and subtitles; no second extraction is needed.
+            meta_job = self._save_metadata(info, canonical, assigned_number, target_folder)
+
+            detected_lang = self._detect_original_language(info)
+            if detected_lang:
+                logger.info(f"Detected Original Audio Language: {detected_lang}")
+
+            if dl_subs:
                 videos = [{
-                    'id': playlist_info.get('id'), 
-                    'title': playlist_info.get('title', 'Unknown'),
+                    'id': info.get('id'),
+                    'title': info.get('title', 'Unknown'),
                     'detected_lang': detected_lang
                 }]
                 self._download_subtitles_api(videos, target_folder, assigned_number)
             
-            # Clean up any orphaned partial files (.f137.mp4 / .f140.m4a) left
-            # behind when FFmpeg is missing or a previous merge failed.
-            self._cleanup_orphaned_partials(target_folder)
-
             logger.info(f"  ✅ Finished #{assigned_number:02d} — {video_title[:60]}")
             return {'success': True}
             
@@ -722,6 +1344,11 @@ class YouTubeDownloader:
         except Exception as e:
             logger.error(f"Error processing {canonical}: {e}")
             return {'error': str(e)}
+        finally:
+            # The URL is logged by the metadata job; let it land before the
+            # task is reported done.
+            if meta_job is not None:
+                meta_job.result()
 
     def _progress_hook(self, d: dict):
         """yt-dlp progress hook — logs progress at key milestones only."""
@@ -731,56 +1358,35 @@ class YouTubeDownloader:
             total = d.get('total_bytes') or d.get('total_bytes_estimate', 0)
             if total > 0:
                 pct = int(downloaded / total * 100)
-                milestone = getattr(self, '_last_milestone', 0)
+                milestone = getattr(self._local, 'last_milestone', 0)
                 next_milestone = milestone + 25
                 if pct >= next_milestone:
-                    self._last_milestone = (pct // 25) * 25
+                    self._local.last_milestone = (pct // 25) * 25
                     speed = d.get('speed', 0)
                     speed_str = f"{speed/1024/1024:.1f}MB/s" if speed else "?"
                     logger.info(f"  ⬇️  {pct}% ({downloaded/1024/1024:.1f}/{total/1024/1024:.1f}MB) [{speed_str}]")
         elif d['status'] == 'finished':
-            self._last_milestone = 0
+            self._local.last_milestone = 0
             logger.info("  ✅ Download finished, processing...")
 
-    def _fetch_info(self, url: str) -> dict:
-        """Fetch video info with retry logic and exponential backoff."""
-        for attempt in range(self.retry_attempts):
-            try:
-                opts = {
-                    **self._ydl_base_opts,
-                    'quiet': True,
-                    'noplaylist': True,
-                    'logger': _YtdlpQuietLogger(),
-                }
-                with yt_dlp.YoutubeDL(opts) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                if not info:
-                    raise DownloadError("No info extracted")
-                return info
-            except Exception as e:
-                if attempt == self.retry_attempts - 1:
-                    raise e
-                sleep_time = (2 ** attempt) + random.uniform(0, 1)
-                logger.warning(f"Fetch attempt {attempt + 1}/{self.retry_attempts} failed for {url}. Retrying in {sleep_time:.1f}s...")
-                time.sleep(sleep_time)
+    def _get_best_translation_source(self, transcripts: list):
+        """Find the best transcript to use as translation source.
 
-    def _get_best_translation_source(self, transcript_list):
-        """Find the best transcript to use as translation source."""
-        try:
-            return transcript_list.find_manually_created_transcript(['en', 'en-US', 'en-GB'])
-        except Exception:
-            pass
-        try:
-            return transcript_list.find_generated_transcript(['en', 'en-US', 'en-GB'])
-        except Exception:
-            pass
-        for t in transcript_list:
-            if t.is_translatable:
-                return t
-        return None
+        Prefers manual English, then generated English (in
+        TRANSLATION_SOURCE_LANGS order), then any translatable track.
+        """
+        manual = {t.language_code: t for t in transcripts if not t.is_generated}
+        generated = {t.language_code: t for t in transcripts if t.is_generated}
+        for by_lang in (manual, generated):
+            for code in TRANSLATION_SOURCE_LANGS:
+                if code in by_lang:
+                    return by_lang[code]
+        return next((t for t in transcripts if t.is_translatable), None)
 
     def _download_subtitles_api(self, videos: List[Dict], folder: Path, assigned_number: int):
         """Download subtitles using the YouTube Transcript API with improved rate limiting."""
+        from youtube_transcript_api import TranscriptsDisabled, NoTranscriptFound
+
         for video in videos:
             vid_id = video.get('id')
             title = video.get('title')
@@ -791,111 +1397,205 @@ class YouTubeDownloader:
                 continue
                 
             base_filename = sanitize_filename(f"{assigned_number:02d}_{title}")
+
+            # Languages already saved by an earlier run need no API calls at all
+            on_disk = {
+                lang for lang in self.subtitle_languages
+                if self._has_subtitle(folder, base_filename, lang)
+            }
+            if len(on_disk) == len(self.subtitle_languages):
+                logger.info(f"Subtitles already on disk for: {title}")
+                continue
             
+            pending: List[Future] = []
             try:
+                self._subtitle_bucket.acquire()
                 transcript_list = self.ytt_api.list(vid_id)
+                # Every hyphen prefix of each handled code ('zh', 'zh-Hans',
+                # 'zh-Hans-CN'), so "req or a regional variant of req is done"
+                # is a single set lookup.
                 processed_langs = set()
+                for lang in on_disk:
+                    processed_langs.update(_lang_prefixes(lang))
+                # One pass over the list; manual tracks come first, so they
+                # win over generated ones with the same code.
+                transcripts = list(transcript_list)
+                available = {}
+                by_base = {}  # 'en' -> first 'en' / 'en-US' / 'en-GB' track
+                for t in transcripts:
+                    available.setdefault(t.language_code, t)
+                    by_base.setdefault(t.language_code.split('-')[0], t)
+                if not available:
+                    logger.warning(f"No transcripts available for: {title}")
+                    continue
 
                 # 1. Download Original transcript
                 try:
-                    original_transcript = None
-                    if detected_lang:
-                        try:
-                            original_transcript = transcript_list.find_transcript([detected_lang])
-                        except Exception:
-                            pass
-                    if not original_transcript:
-                        for t in transcript_list:
-                            if not t.is_generated:
-                                original_transcript = t
-                                break
-                    if not original_transcript:
-                        original_transcript = next(iter(transcript_list), None)
+                    original_transcript = (
+                        available.get(detected_lang)
+                        or next((t for t in available.values() if not t.is_generated), None)
+                        or next(iter(available.values()), None)
+                    )
                     
                     if original_transcript:
                         lang = original_transcript.language_code
                         logger.info(f"Downloading Original Subtitle ({lang})...")
-                        self._save_transcript(original_transcript, folder, base_filename, lang)
-                        processed_langs.add(lang)
-                        time.sleep(random.uniform(1, 2))
+                        self._save_transcript(original_transcript, folder, base_filename, lang, pending)
+                        processed_langs.update(_lang_prefixes(lang))
                 except Exception as e:
                     logger.warning(f"Failed to get original transcript: {e}")
 
                 # 2. Direct Match for requested languages
+                direct = []
                 for req_lang in self.subtitle_languages:
-                    if any(l == req_lang or l.startswith(req_lang + '-') for l in processed_langs):
+                    if req_lang in processed_langs:
                         continue
-                    try:
-                        transcript = transcript_list.find_transcript([req_lang])
-                        self._save_transcript(transcript, folder, base_filename, req_lang)
-                        processed_langs.add(req_lang)
-                        time.sleep(random.uniform(1, 2))
-                    except (NoTranscriptFound, ValueError):
-                        pass
-                    except Exception as e:
-                        logger.warning(f"Error finding {req_lang} transcript: {e}")
+                    # Exact code first, then any track sharing the base code
+                    # ('en' <-> 'en-US', 'pt-BR' <-> 'pt')
+                    transcript = available.get(req_lang) or by_base.get(req_lang.split('-')[0])
+                    if transcript is not None:
+                        direct.append((transcript, req_lang))
+                        processed_langs.update(_lang_prefixes(req_lang))
 
                 # 3. Translate missing languages
-                missing_langs = []
-                for req in self.subtitle_languages:
-                    if not any(l == req or l.startswith(req + '-') for l in processed_langs):
-                        missing_langs.append(req)
-
-                if missing_langs:
-                    source = self._get_best_translation_source(transcript_list)
-                    if source:
-                        for req_lang in missing_langs:
-                            self._translate_with_retry(source, req_lang, folder, base_filename)
+                missing_langs = [req for req in self.subtitle_languages if req not in processed_langs]
+
+                source = self._get_best_translation_source(transcripts) if missing_langs else None
+                if source is None or not source.is_translatable:
+                    # Every translate() call would fail; don't spend requests on it
+                    missing_langs = []
+
+                # Direct fetches and translations are independent requests,
+                # so run them side by side in one small pool.
+                if direct or missing_langs:
+                    workers = min(len(direct) + len(missing_langs), MAX_SUBTITLE_WORKERS)
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = [
+                            executor.submit(self._save_transcript, transcript, folder, base_filename, req_lang, pending)
+                            for transcript, req_lang in direct
+                        ]
+                        futures += [
+                            executor.submit(self._translate, source, req_lang, folder, base_filename, pending)
+                            for req_lang in missing_langs
+                        ]
+                        for future in as_completed(futures):
+                            future.result()
 
             except (TranscriptsDisabled, NoTranscriptFound):
                 logger.warning(f"No transcripts available for: {title}")
             except Exception as e:
                 logger.warning(f"Subtitle API Error on {title}: {e}")
+            finally:
+                # Files must be on disk before the folder-wide SRT passes run
+                for job in pending:
+                    try:
+                        job.result()
+                    except Exception as e:
+                        logger.error(f"Failed to write subtitle file: {e}")
+
+    def _translate(self, source, req_lang: str, folder: Path, base_filename: str, pending: Optional[list] = None):
+        """Translate `source` into `req_lang` and save it (fetch retries live in `_fetch_transcript`)."""
+        try:
+            logger.info(f"Translating {source.language_code} -> {req_lang}...")
+            translated = source.translate(req_lang)
+        except Exception as e:
+            logger.warning(f"Translation failed for {req_lang}: {e}")
+            return
+        self._save_transcript(translated, folder, base_filename, req_lang, pending)
+
+    def _fetch_transcript(self, transcript):
+        """Fetch a transcript, backing off exponentially on rate limiting.
+
+        Every attempt takes a token from the shared bucket. A 429 throttles
+        the bucket for all workers and this one also sleeps (Retry-After when
+        given); each success lets the bucket ramp back up.
+        """
+        # The timedtext URL identifies the track, including any translation
+        key = getattr(transcript, '_url', None)
+        if key:
+            with self._fetched_lock:
+                if key in self._fetched_cache:
+                    self._fetched_cache.move_to_end(key)
+                    return self._fetched_cache[key]
 
-    def _translate_with_retry(self, source, req_lang: str, folder: Path, base_filename: str):
-        """Translate transcript with exponential backoff on rate limiting."""
         for attempt in range(RATE_LIMIT_MAX_RETRIES):
+            self._subtitle_bucket.acquire()
             try:
-                logger.info(f"Translating {source.language_code} -> {req_lang}...")
-                translated = source.translate(req_lang)
-                self._save_transcript(translated, folder, base_filename, req_lang)
-                time.sleep(random.uniform(2, 4))
-                return
+                fetched = transcript.fetch()
+                self._subtitle_bucket.relax()
+                if key:
+                    with self._fetched_lock:
+                        self._fetched_cache[key] = fetched
+                        if len(self._fetched_cache) > FETCHED_CACHE_SIZE:
+                            self._fetched_cache.popitem(last=False)
+                return fetched
             except Exception as e:
-                err = str(e).lower()
-                if "blocking" in err or "too many requests" in err:
-                    sleep_time = RATE_LIMIT_INITIAL_SLEEP * (2 ** attempt)
-                    logger.warning(f"⚠️ Rate Limit Hit (attempt {attempt + 1}/{RATE_LIMIT_MAX_RETRIES}). Sleeping {sleep_time}s...")
-                    time.sleep(sleep_time)
-                else:
-                    logger.warning(f"Translation failed for {req_lang}: {e}")
-                    return
-        
-        logger.error(f"❌ Translation to {req_lang} failed after {RATE_LIMIT_MAX_RETRIES} retries")
+                if not _is_rate_limit_error(e) or attempt == RATE_LIMIT_MAX_RETRIES - 1:
+                    raise
+                sleep_time = _retry_after_seconds(e) or (
+                    RATE_LIMIT_INITIAL_SLEEP * (2 ** attempt) + random.uniform(0, 5)
+                )
+                self._subtitle_bucket.throttle()
+                logger.warning(f"⚠️ Rate Limit Hit (attempt {attempt + 1}/{RATE_LIMIT_MAX_RETRIES}). Sleeping {sleep_time:.0f}s...")
+                time.sleep(sleep_time)
+
+    def _has_subtitle(self, folder: Path, base_filename: str, lang_code: str) -> bool:
+        """Return True if a non-empty SRT (manual or auto) for `lang_code` exists."""
+        for suffix in ("", ".auto"):
+            path = folder / f"{base_filename}.{lang_code}{suffix}.srt"
+            if _has_min_size(path):
+                return True
+        return False
+
+    def _write_file(self, path: Path, data: bytes, pending: Optional[list], label: str):
+        """Write `data` atomically, on the I/O pool when `pending` is given.
+
+        The "Saved <label>" line is logged only once the file is on disk.
+        """
+        if pending is None:
+            self._write_and_log(path, data, label)
+        else:
+            pending.append(self._io_pool.submit(self._write_and_log, path, data, label))
+
+    @staticmethod
+    def _write_and_log(path: Path, data: bytes, label: str):
+        _atomic_write(path, data)
+        logger.info(f"Saved {label}: {path.name}")
+
+    def _save_transcript(self, transcript, folder: Path, base_filename: str, lang_code: str,
+                         pending: Optional[list] = None) -> bool:
+        """Save transcript as both SRT and TXT formats.
 
-    def _save_transcript(self, transcript, folder: Path, base_filename: str, lang_code: str):
-        """Save transcript as both SRT and TXT formats."""
+        Returns True if the transcript was fetched from the network, False if
+        both files already existed (or saving failed). When `pending` is
+        given, the file writes are queued on the I/O pool and their futures
+        appended to it; otherwise they are written before returning.
+        """
         try:
-            fetched = transcript.fetch()
             suffix = ".auto" if transcript.is_generated else ""
+            srt_path = folder / f"{base_filename}.{lang_code}{suffix}.srt"
+            txt_path = folder / f"{base_filename}.{lang_code}{suffix}.txt"
+            srt_done = _has_min_size(srt_path)
+            txt_done = _has_min_size(txt_path)
+            if srt_done and txt_done:
+                logger.info(f"SRT already exists: {srt_path.name}")
+                return False
+
+            fetched = self._fetch_transcript(transcript)
             
             # Save SRT
-            srt_content = SRTFormatter().format_transcript(fetched)
-            srt_path = folder / f"{base_filename}.{lang_code}{suffix}.srt"
-            if not srt_path.exists() or srt_path.stat().st_size < 10:
-                with open(srt_path, "w", encoding="utf-8") as f:
-                    f.write(srt_content)
-                logger.info(f"Saved SRT: {srt_path.name}")
+            if not srt_done:
+                srt_content = _formatters()[0].format_transcript(fetched)
+                self._write_file(srt_path, srt_content.encode("utf-8"), pending, "SRT")
             else:
                 logger.info(f"SRT already exists: {srt_path.name}")
                 
             # Save TXT
-            txt_content = TextFormatter().format_transcript(fetched)
-            txt_path = folder / f"{base_filename}.{lang_code}{suffix}.txt"
-            if not txt_path.exists() or txt_path.stat().st_size < 10:
-                with open(txt_path, "w", encoding="utf-8") as f:
-                    f.write(txt_content)
-                logger.info(f"Saved TXT: {txt_path.name}")
+            if not txt_done:
+                txt_content = _formatters()[1].format_transcript(fetched)
+                self._write_file(txt_path, txt_content.encode("utf-8"), pending, "TXT")
+            return True
                 
         except Exception as e:
             logger.error(f"Failed to save transcript {lang_code}: {e}")
+            return False
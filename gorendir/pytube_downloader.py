@@ -10,10 +10,11 @@ import os
 import logging
 from pathlib import Path
 from typing import List, Dict, Optional, Union, Tuple
-import re
 import time
 import random
 
+from .utils import sanitize_filename
+
 DEFAULT_SUBTITLE_LANGUAGES = ["az", "en", "fa", "tr"]
 DEFAULT_MAX_RESOLUTION = 1080
 
@@ -76,16 +77,8 @@ class pytube_YouTubeDownloader:
         return "playlist" in url.lower() or "list=" in url.lower()
 
     def _sanitize_filename(self, filename: str) -> str:
-        """Sanitizes a string to be used as a filename."""
-        if not isinstance(filename, str):
-            filename = str(filename)
-
-        # Remove invalid characters for filenames
-        filename = re.sub(r'[\\/:*?"<>|]', '', filename)
-        # Normalize spaces (keep spaces, don't replace with underscore for readability)
-        filename = re.sub(r'\s+', ' ', filename).strip()
-        # Limit length
-        return filename[:200].strip() or "untitled"
+        """Sanitizes a string to be used as a filename (see utils.sanitize_filename)."""
+        return sanitize_filename(filename)
 
     def _create_folder(self, title: str, uploader: str, url: str, force: bool) -> Optional[Path]:
         """
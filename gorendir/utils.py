@@ -1,8 +1,10 @@
 import os
 import re
 import logging
+from array import array
+from bisect import bisect_left
 from pathlib import Path
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Union, Iterable
 import hashlib
 
 logger = logging.getLogger("gorendir")
@@ -10,6 +12,11 @@ logger = logging.getLogger("gorendir")
 # ──────────────────────────────────────────────────────────────
 # Shared filename sanitizer (single source of truth)
 # ──────────────────────────────────────────────────────────────
+# Compiled once: sanitize_filename runs for every video, folder and subtitle
+_INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Safe filename generator — single source of truth for the whole project.
@@ -24,9 +31,9 @@ def sanitize_filename(filename: str) -> str:
         filename = str(filename)
     
     # Remove invalid characters for all major OSes
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
+    filename = _INVALID_FILENAME_CHARS_RE.sub('', filename)
     # Normalize whitespace
-    filename = re.sub(r'\s+', ' ', filename).strip()
+    filename = _WHITESPACE_RE.sub(' ', filename).strip()
     # Truncate to avoid OS path limits (255 chars for most filesystems)
     if len(filename) > 200:
         filename = filename[:200].strip()
@@ -46,6 +53,39 @@ def file_hash(filepath: Union[str, Path], algorithm: str = 'md5', chunk_size: in
         return None
 
 
+class UrlIndex:
+    """
+    Memory-bounded set of URLs for "already downloaded" checks.
+
+    - Stores an 8-byte BLAKE2b digest per URL instead of the URL string
+    - Loaded URLs live in one sorted array (bisect lookup, ~8 bytes each)
+    - URLs added during the session go into a small set of digests
+    - Collisions are negligible (64-bit digests), so there are no
+      Bloom-filter style false positives that would skip new videos
+    """
+
+    def __init__(self, urls: Iterable[str] = ()):
+        self._sorted = array('Q', sorted(self._digest(u) for u in urls if u))
+        self._recent = set()
+
+    @staticmethod
+    def _digest(url: str) -> int:
+        return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big')
+
+    def __contains__(self, url: str) -> bool:
+        d = self._digest(url)
+        if d in self._recent:
+            return True
+        i = bisect_left(self._sorted, d)
+        return i < len(self._sorted) and self._sorted[i] == d
+
+    def add(self, url: str) -> None:
+        self._recent.add(self._digest(url))
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._recent)
+
+
 def convert_srt_to_text(
     srt_file_path: Union[str, Path],
     append_text: str = '*******',
@@ -103,8 +143,7 @@ def convert_srt_to_text(
         out_path = Path(output_file) if output_file else srt_path.with_suffix('.txt')
         out_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(out_path, 'w', encoding='utf-8') as f:
-            f.write(full_text)
+        out_path.write_bytes(full_text.encode('utf-8'))
             
         logger.info(f"Converted SRT -> TXT: {out_path.name} ({len(texts)} lines)")
         return str(out_path)
@@ -189,8 +189,7 @@ def vtt_to_srt_clean(vtt_path: Path, output_suffix: str = ".clean.srt") -> Optio
 
     srt_content = "\n".join(srt_lines)
 
-    with open(srt_path, "w", encoding="utf-8") as f:
-        f.write(srt_content)
+    srt_path.write_bytes(srt_content.encode("utf-8"))
 
     logger.info(f"✅ Cleaned SRT saved to: {srt_path.name} ({len(transcript)} lines)")
     return srt_path